@@ -6,7 +6,7 @@
 #
 """Provides an assertion visitor to transform assertions to AST."""
 import ast
-from typing import Any, List, Set
+from typing import Any, List, Optional, Set, Tuple
 
 import pynguin.assertion.assertionvisitor as av
 import pynguin.assertion.noneassertion as na
@@ -16,6 +16,14 @@ import pynguin.testcase.variable.variablereference as vr
 import pynguin.utils.ast_util as au
 from pynguin.utils.namingscope import NamingScope
 
+# Operator nodes carry no state, thus we share them between all generated assertions.
+_EQ = ast.Eq()
+_IS = ast.Is()
+_IS_NOT = ast.IsNot()
+# Indexed by whether the value is expected to be None.  Assertions created by the
+# test seeding may hold a non-bool value, e.g., None, thus index by its truth value.
+_NONE_OPS = (_IS_NOT, _IS)
+
 
 class AssertionToAstVisitor(av.AssertionVisitor):
     """An assertion visitor that transforms assertions into AST nodes."""
@@ -32,6 +40,9 @@ class AssertionToAstVisitor(av.AssertionVisitor):
         self._common_modules = common_modules
         self._variable_names = variable_names
         self._nodes: List[ast.stmt] = []
+        # The pytest.approx function and its tolerance keywords are the same for
+        # every float assertion, so we build them on first use and share them.
+        self._approx_nodes: Optional[Tuple[ast.Attribute, List[ast.keyword]]] = None
 
     @property
     def nodes(self) -> List[ast.stmt]:
@@ -53,9 +64,7 @@ class AssertionToAstVisitor(av.AssertionVisitor):
         """
         if isinstance(assertion.value, bool):
             self._nodes.append(
-                self._create_constant_assert(
-                    assertion.source, ast.Is(), assertion.value
-                )
+                self._create_constant_assert(assertion.source, _IS, assertion.value)
             )
         elif isinstance(assertion.value, float):
             self._nodes.append(
@@ -63,9 +72,7 @@ class AssertionToAstVisitor(av.AssertionVisitor):
             )
         else:
             self._nodes.append(
-                self._create_constant_assert(
-                    assertion.source, ast.Eq(), assertion.value
-                )
+                self._create_constant_assert(assertion.source, _EQ, assertion.value)
             )
 
     def visit_none_assertion(self, assertion: na.NoneAssertion) -> None:
@@ -77,7 +84,7 @@ class AssertionToAstVisitor(av.AssertionVisitor):
         """
         self._nodes.append(
             self._create_constant_assert(
-                assertion.source, ast.Is() if assertion.value else ast.IsNot(), None
+                assertion.source, _NONE_OPS[bool(assertion.value)], None
             )
         )
 
@@ -93,42 +100,44 @@ class AssertionToAstVisitor(av.AssertionVisitor):
             msg=None,
         )
 
+    def _get_approx_nodes(self) -> Tuple[ast.Attribute, List[ast.keyword]]:
+        if self._approx_nodes is None:
+            float_precision = config.configuration.test_case_output.float_precision
+            self._approx_nodes = (
+                ast.Attribute(
+                    value=ast.Name(id="pytest", ctx=au.LOAD),
+                    attr="approx",
+                    ctx=au.LOAD,
+                ),
+                [
+                    ast.keyword(
+                        arg="abs",
+                        value=ast.Constant(value=float_precision, kind=None),
+                    ),
+                    ast.keyword(
+                        arg="rel",
+                        value=ast.Constant(value=float_precision, kind=None),
+                    ),
+                ],
+            )
+        return self._approx_nodes
+
     def _create_float_delta_assert(
         self, var: vr.VariableReference, value: Any
     ) -> ast.Assert:
         self._common_modules.add("pytest")
-        float_precision = config.configuration.test_case_output.float_precision
-
+        approx_func, approx_keywords = self._get_approx_nodes()
         return ast.Assert(
             test=ast.Compare(
                 left=au.create_var_name(self._variable_names, var, load=True),
-                ops=[ast.Eq()],
+                ops=[_EQ],
                 comparators=[
                     ast.Call(
-                        func=ast.Attribute(
-                            value=ast.Name(id="pytest", ctx=ast.Load()),
-                            attr="approx",
-                            ctx=ast.Load(),
-                        ),
+                        func=approx_func,
                         args=[
                             ast.Constant(value=value, kind=None),
                         ],
-                        keywords=[
-                            ast.keyword(
-                                arg="abs",
-                                value=ast.Constant(
-                                    value=float_precision,
-                                    kind=None,
-                                ),
-                            ),
-                            ast.keyword(
-                                arg="rel",
-                                value=ast.Constant(
-                                    value=float_precision,
-                                    kind=None,
-                                ),
-                            ),
-                        ],
+                        keywords=approx_keywords,
                     ),
                 ],
             ),
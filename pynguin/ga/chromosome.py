@@ -19,6 +19,15 @@ import pynguin.ga.fitnessfunction as ff
 class Chromosome(metaclass=abc.ABCMeta):
     """An abstract base class for chromosomes"""
 
+    __slots__ = (
+        "_fitness_functions",
+        "_fitness_values",
+        "_number_of_evaluations",
+        "_changed",
+        "_distance",
+        "_rank",
+    )
+
     def __init__(self, orig: Optional[Chromosome] = None):
         """
         Args:
@@ -195,6 +204,8 @@ class Chromosome(metaclass=abc.ABCMeta):
 
         This chromosome will be split at `position1`, the other at `position2`,
         and the crossover will be performed with these pre- and suffixes.
+        Implementations must not modify the other chromosome and must replace the
+        content of this chromosome instead of editing it in place.
 
         Args:
             other: The other chromosome to perform the crossover with
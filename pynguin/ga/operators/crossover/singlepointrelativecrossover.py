@@ -5,6 +5,7 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 """Provides a single point relative crossover."""
+import copy
 from math import floor
 from typing import TypeVar
 
@@ -33,7 +34,9 @@ class SinglePointRelativeCrossOver(CrossOverFunction[T]):
         split_point = randomness.next_float()
         position1 = floor((parent1.size() - 1) * split_point) + 1
         position2 = floor((parent2.size() - 1) * split_point) + 1
-        clone1 = parent1.clone()
-        clone2 = parent2.clone()
-        parent1.cross_over(clone2, position1, position2)
-        parent2.cross_over(clone1, position2, position1)
+        # The second crossover needs the original content of the first parent.  A
+        # shallow copy suffices, because a crossover never modifies the other
+        # chromosome and replaces its own content instead of editing it.
+        original1 = copy.copy(parent1)
+        parent1.cross_over(parent2, position1, position2)
+        parent2.cross_over(original1, position2, position1)
@@ -7,7 +7,9 @@
 """Provides a chromosome for a single test case."""
 from __future__ import annotations
 
-from typing import Optional
+import math
+import sys
+from typing import Optional, Tuple
 
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
@@ -21,6 +23,15 @@ from pynguin.utils import randomness
 class TestCaseChromosome(chrom.Chromosome):
     """A chromosome that encodes a single test case."""
 
+    __slots__ = (
+        "_test_case",
+        "_test_factory",
+        "_last_execution_result",
+        "_num_mutations",
+        "_cached_last_mutatable",
+        "_hash_cache",
+    )
+
     def __init__(
         self,
         test_case: Optional[tc.TestCase] = None,
@@ -45,12 +56,17 @@ class TestCaseChromosome(chrom.Chromosome):
             self._changed = True
             self._last_execution_result: Optional[ExecutionResult] = None
             self._num_mutations = 0
+            self._cached_last_mutatable: Optional[
+                Tuple[Optional[ExecutionResult], int, Optional[int]]
+            ] = None
         else:
             self._test_case = orig._test_case.clone()
             self._test_factory = orig._test_factory
             self._changed = orig._changed
             self._last_execution_result = orig._last_execution_result
             self._num_mutations = orig._num_mutations
+            self._cached_last_mutatable = orig._cached_last_mutatable
+        self._hash_cache: Optional[Tuple[tc.TestCase, int, int]] = None
 
     @property
     def test_case(self) -> tc.TestCase:
@@ -69,11 +85,16 @@ class TestCaseChromosome(chrom.Chromosome):
         # TODO(fk) what to do with this when crossover is used?
         return self._num_mutations
 
+    def set_changed(self, changed: bool) -> None:
+        super().set_changed(changed)
+        if changed:
+            self._hash_cache = None
+
     def size(self) -> int:
         return self._test_case.size()
 
-    def length(self) -> int:
-        return self.size()
+    # A test case has no sub-elements, so its length is its size.
+    length = size
 
     def cross_over(
         self, other: chrom.Chromosome, position1: int, position2: int
@@ -81,67 +102,62 @@ class TestCaseChromosome(chrom.Chromosome):
         assert isinstance(
             other, TestCaseChromosome
         ), "Cannot perform crossover with " + str(type(other))
-        offspring = self.clone()
-        offspring.test_case.statements.clear()
+        offspring = self._test_case.clone_empty()
 
         assert self._test_factory is not None, "Crossover requires a test factory."
 
-        for i in range(position1):
-            offspring.test_case.add_statement(
-                self.test_case.get_statement(i).clone(offspring.test_case)
-            )
+        offspring.add_statements(
+            [
+                statement.clone(offspring)
+                for statement in self._test_case.statements[:position1]
+            ]
+        )
 
         for j in range(position2, other.test_case.size()):
             self._test_factory.append_statement(
-                offspring.test_case, other.test_case.get_statement(j)
+                offspring, other.test_case.get_statement(j)
             )
 
-        if (
-            offspring.test_case.size()
-            < config.configuration.search_algorithm.chromosome_length
-        ):
-            self._test_case = offspring.test_case
+        if offspring.size() < config.configuration.search_algorithm.chromosome_length:
+            self._test_case = offspring
             self.set_changed(True)
 
     def mutate(self) -> None:
         changed = False
+        search_config = config.configuration.search_algorithm
 
         if (
-            config.configuration.search_algorithm.chop_max_length
-            and self.size() >= config.configuration.search_algorithm.chromosome_length
+            search_config.chop_max_length
+            and self.size() >= search_config.chromosome_length
         ):
             last_mutatable_position = self.get_last_mutatable_statement()
             if last_mutatable_position is not None:
                 self._test_case.chop(last_mutatable_position)
                 changed = True
 
-        # In case mutation removes all calls on the SUT.
-        backup = self.test_case.clone()
+        # In case mutation removes all calls on the SUT.  Only deletion and change
+        # can remove statements, so we only take a backup before one of them runs.
+        backup: Optional[tc.TestCase] = None
 
-        if (
-            randomness.next_float()
-            <= config.configuration.search_algorithm.test_delete_probability
-        ):
+        if randomness.next_float() <= search_config.test_delete_probability:
+            backup = self._test_case.clone()
             if self._mutation_delete():
                 changed = True
 
-        if (
-            randomness.next_float()
-            <= config.configuration.search_algorithm.test_change_probability
-        ):
+        if randomness.next_float() <= search_config.test_change_probability:
+            if backup is None:
+                backup = self._test_case.clone()
             if self._mutation_change():
                 changed = True
 
-        if (
-            randomness.next_float()
-            <= config.configuration.search_algorithm.test_insert_probability
-        ):
+        if randomness.next_float() <= search_config.test_insert_probability:
             if self._mutation_insert():
                 changed = True
 
         assert self._test_factory, "Required for mutation"
         if not self._test_factory.has_call_on_sut(self._test_case):
-            self._test_case = backup
+            if backup is not None:
+                self._test_case = backup
             self._mutation_insert()
 
         if changed:
@@ -154,12 +170,15 @@ class TestCaseChromosome(chrom.Chromosome):
             return False
 
         changed = False
+        statements = self._test_case.statements
+        next_geometric = randomness.next_geometric
         p_per_statement = 1.0 / (last_mutatable_statement + 1)
-        for idx in reversed(range(last_mutatable_statement + 1)):
-            if idx >= self.size():
-                continue
-            if randomness.next_float() <= p_per_statement:
+        # Jump directly to the next statement whose deletion trial succeeds.
+        idx = last_mutatable_statement - next_geometric(p_per_statement)
+        while idx >= 0:
+            if idx < len(statements):
                 changed |= self._delete_statement(idx)
+            idx -= 1 + next_geometric(p_per_statement)
         return changed
 
     def _delete_statement(self, idx: int) -> bool:
@@ -173,23 +192,22 @@ class TestCaseChromosome(chrom.Chromosome):
             return False
 
         changed = False
+        statements = self._test_case.statements
+        next_geometric = randomness.next_geometric
         p_per_statement = 1.0 / (last_mutatable_statement + 1.0)
-        position = 0
+        # Jump directly to the next statement whose change trial succeeds.
+        position = next_geometric(p_per_statement)
         while position <= last_mutatable_statement:
-            if randomness.next_float() < p_per_statement:
-                statement = self._test_case.get_statement(position)
-                old_distance = statement.ret_val.distance
-                if statement.mutate():
+            statement = statements[position]
+            old_distance = statement.ret_val.distance
+            if statement.mutate():
+                changed = True
+            else:
+                assert self._test_factory, "Mutation requires a test factory."
+                if self._test_factory.change_random_call(self._test_case, statement):
                     changed = True
-                else:
-                    assert self._test_factory, "Mutation requires a test factory."
-                    if self._test_factory.change_random_call(
-                        self._test_case, statement
-                    ):
-                        changed = True
-                statement.ret_val.distance = old_distance
-                position = statement.get_position()
-            position += 1
+            statement.ret_val.distance = old_distance
+            position = statement.get_position() + 1 + next_geometric(p_per_statement)
 
         return changed
 
@@ -201,12 +219,14 @@ class TestCaseChromosome(chrom.Chromosome):
             Whether or not the test case was changed
         """
         changed = False
-        alpha = config.configuration.search_algorithm.statement_insertion_probability
-        exponent = 1
-        while (
-            randomness.next_float() <= pow(alpha, exponent)
-            and self.size() < config.configuration.search_algorithm.chromosome_length
+        statements = self._test_case.statements
+        search_config = config.configuration.search_algorithm
+        chromosome_length = search_config.chromosome_length
+        for _ in range(
+            _next_insertion_count(search_config.statement_insertion_probability)
         ):
+            if len(statements) >= chromosome_length:
+                break
             assert self._test_factory, "Mutation requires a test factory."
             max_position = self.get_last_mutatable_statement()
             if max_position is None:
@@ -219,8 +239,7 @@ class TestCaseChromosome(chrom.Chromosome):
             position = self._test_factory.insert_random_statement(
                 self._test_case, max_position
             )
-            exponent += 1
-            if 0 <= position < self.size():
+            if 0 <= position < len(statements):
                 changed = True
         return changed
 
@@ -233,19 +252,33 @@ class TestCaseChromosome(chrom.Chromosome):
         Returns:
             The index of the last mutatable statement, if any.
         """
+        # The result only depends on the last execution result and the size of the
+        # test case, so we can reuse it as long as neither of them changed.
+        result = self._last_execution_result
+        size = self._test_case.size()
+        cached = self._cached_last_mutatable
+        if cached is not None and cached[0] is result and cached[1] == size:
+            return cached[2]
+        last_mutatable = self._compute_last_mutatable_statement(result, size)
+        self._cached_last_mutatable = (result, size, last_mutatable)
+        return last_mutatable
+
+    @staticmethod
+    def _compute_last_mutatable_statement(
+        result: Optional[ExecutionResult], size: int
+    ) -> Optional[int]:
         # We are empty, so there can't be a last mutatable statement.
-        if self.size() == 0:
+        if size == 0:
             return None
 
-        result = self.get_last_execution_result()
         if result is not None and result.has_test_exceptions():
             position = result.get_first_position_of_thrown_exception()
             assert position is not None
             # The position might not be valid anymore.
-            if position < self.size():
+            if position < size:
                 return position
         # No exception, so the entire test case can be mutated.
-        return self.size() - 1
+        return size - 1
 
     def get_last_execution_result(self) -> Optional[ExecutionResult]:
         """Get the last execution result.
@@ -290,4 +323,39 @@ class TestCaseChromosome(chrom.Chromosome):
         return self._test_case == other._test_case
 
     def __hash__(self):
-        return hash(self._test_case)
+        # Hashing a test case hashes all its statements, so we keep the hash until
+        # the chromosome is changed.  The test case is also modified from outside,
+        # e.g., by chopping it, thus we additionally check its identity and size.
+        test_case = self._test_case
+        size = test_case.size()
+        cached = self._hash_cache
+        if cached is None or cached[0] is not test_case or cached[1] != size:
+            cached = (test_case, size, hash(test_case))
+            self._hash_cache = cached
+        return cached[2]
+
+
+def _next_insertion_count(alpha: float) -> int:
+    """Draw how many statements shall be inserted by an insertion mutation.
+
+    The n-th insertion is attempted with probability alpha^n, provided that the
+    previous one was attempted.  Thus, at least n insertions are attempted with
+    probability alpha^(n(n+1)/2), which allows us to draw the count from a single
+    random number instead of one random number per insertion.
+
+    Args:
+        alpha: The statement insertion probability
+
+    Returns:
+        The number of insertions to attempt
+    """
+    if alpha <= 0.0:
+        return 0
+    uniform = randomness.next_float()
+    if uniform <= 0.0 or alpha >= 1.0:
+        return sys.maxsize
+    if uniform > alpha:
+        return 0
+    # Largest n with n(n+1)/2 <= log(uniform) / log(alpha).
+    bound = math.log(uniform) / math.log(alpha)
+    return int((math.sqrt(8.0 * bound + 1.0) - 1.0) / 2.0)
@@ -185,12 +185,12 @@ class TestSuiteGenerationAlgorithmFactory(
         Raises:
             ConfigurationException: if an unknown algorithm was requested
         """
-        if config.configuration.algorithm in cls._strategies:
-            strategy = cls._strategies.get(config.configuration.algorithm)
-            assert strategy, "Strategy cannot be defined as None"
-            cls._logger.info("Use strategy: %s" % config.configuration.algorithm)
-            return strategy()
-        raise ConfigurationException("No suitable generation strategy found.")
+        algorithm = config.configuration.algorithm
+        strategy = cls._strategies.get(algorithm)
+        if strategy is None:
+            raise ConfigurationException("No suitable generation strategy found.")
+        cls._logger.info("Use strategy: %s", algorithm)
+        return strategy()
 
     @classmethod
     def _get_selection_function(cls) -> SelectionFunction[tsc.TestSuiteChromosome]:
@@ -202,17 +202,12 @@ class TestSuiteGenerationAlgorithmFactory(
         Raises:
             ConfigurationException: if an unknown function was requested
         """
-        if config.configuration.search_algorithm.selection in cls._selections:
-            strategy = cls._selections.get(
-                config.configuration.search_algorithm.selection
-            )
-            assert strategy, "Selection function cannot be defined as None"
-            cls._logger.info(
-                "Use selection function: %s"
-                % config.configuration.search_algorithm.selection
-            )
-            return strategy()
-        raise ConfigurationException("No suitable selection function found.")
+        selection = config.configuration.search_algorithm.selection
+        strategy = cls._selections.get(selection)
+        if strategy is None:
+            raise ConfigurationException("No suitable selection function found.")
+        cls._logger.info("Use selection function: %s", selection)
+        return strategy()
 
     def _get_crossover_function(self) -> CrossOverFunction[tsc.TestSuiteChromosome]:
         """Provides a crossover function for the selected algorithm.
@@ -96,6 +96,9 @@ class DefaultTestCase(tc.TestCase):
         test_case._id = self._id_generator.inc()
         return test_case
 
+    def clone_empty(self) -> tc.TestCase:
+        return DefaultTestCase()
+
     def get_dependencies(self, var: vr.VariableReference) -> Set[vr.VariableReference]:
         dependencies = set()
 
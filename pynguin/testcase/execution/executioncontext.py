@@ -27,6 +27,11 @@ class ExecutionContext:
         self._variable_names = NamingScope()
         self._modules_aliases = NamingScope(prefix="module")
         self._global_namespace: Dict[str, ModuleType] = {}
+        # Every statement of the execution is transformed with the same scopes, thus
+        # one visitor suffices.
+        self._statement_visitor = stmt_to_ast.StatementToAstVisitor(
+            self._modules_aliases, self._variable_names
+        )
 
     @property
     def local_namespace(self) -> Dict[str, Any]:
@@ -78,20 +83,17 @@ class ExecutionContext:
             An executable ast node.
         """
         modules_before = len(self._modules_aliases.known_name_indices)
-        visitor = stmt_to_ast.StatementToAstVisitor(
-            self._modules_aliases, self._variable_names
-        )
+        visitor = self._statement_visitor
         statement.accept(visitor)
+        nodes = visitor.pop_nodes()
         if modules_before != len(self._modules_aliases.known_name_indices):
             # new module added
             # TODO(fk) cleaner solution?
             self._global_namespace = ExecutionContext._create_global_namespace(
                 self._modules_aliases
             )
-        assert (
-            len(visitor.ast_nodes) == 1
-        ), "Expected statement to produce exactly one ast node"
-        return ExecutionContext._wrap_node_in_module(visitor.ast_nodes[0])
+        assert len(nodes) == 1, "Expected statement to produce exactly one ast node"
+        return ExecutionContext._wrap_node_in_module(nodes[0])
 
     @staticmethod
     def _wrap_node_in_module(node: ast.stmt) -> ast.Module:
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import ast
 from inspect import Parameter
-from typing import Any, List, cast
+from typing import Any, Dict, List, Optional, Tuple
 
 import pynguin.testcase.statements.assignmentstatement as assign_stmt
 import pynguin.testcase.statements.collectionsstatements as coll_stmt
@@ -18,15 +18,29 @@ import pynguin.testcase.statements.parametrizedstatements as param_stmt
 import pynguin.testcase.statements.primitivestatements as prim_stmt
 import pynguin.testcase.statements.statementvisitor as sv
 import pynguin.utils.ast_util as au
-from pynguin.utils.generic.genericaccessibleobject import (
-    GenericCallableAccessibleObject,
-)
 from pynguin.utils.namingscope import NamingScope
 
+# Like the context nodes in ast_util, these nodes are shared between all generated
+# statements.
+_PASS_STMT = ast.Pass()
+# The exception type caught when wrapping the nodes of a statement.
+_BASE_EXC_NAME = ast.Name(ctx=au.LOAD, id="BaseException")
+# The builtin used to create empty sets, for which there is no literal.
+_SET_BUILTIN_NAME = ast.Name(id="set", ctx=au.LOAD)
+
 
 class StatementToAstVisitor(sv.StatementVisitor):
     """Visitor that transforms statements into a list of AST nodes."""
 
+    __slots__ = (
+        "_ast_nodes",
+        "_variable_names",
+        "_module_aliases",
+        "_module_alias_nodes",
+        "_module_attribute_nodes",
+        "_wrap_nodes",
+    )
+
     def __init__(
         self,
         module_aliases: NamingScope,
@@ -44,6 +58,8 @@ class StatementToAstVisitor(sv.StatementVisitor):
         self._ast_nodes: List[ast.stmt] = []
         self._variable_names = variable_names
         self._module_aliases = module_aliases
+        self._module_alias_nodes: Dict[str, ast.Name] = {}
+        self._module_attribute_nodes: Dict[Tuple[str, str], ast.Attribute] = {}
         self._wrap_nodes = wrap_nodes
 
     def append_nodes(self, statements: List[ast.stmt]) -> None:
@@ -77,9 +93,9 @@ class StatementToAstVisitor(sv.StatementVisitor):
                     body=self._ast_nodes,
                     handlers=[
                         ast.ExceptHandler(
-                            body=[ast.Pass()],
+                            body=[_PASS_STMT],
                             name=None,
-                            type=ast.Name(ctx=ast.Load(), id="BaseException"),
+                            type=_BASE_EXC_NAME,
                         )
                     ],
                     orelse=[],
@@ -89,6 +105,18 @@ class StatementToAstVisitor(sv.StatementVisitor):
             return nodes
         return self._ast_nodes
 
+    def pop_nodes(self) -> List[ast.stmt]:
+        """Provides the generated AST nodes and starts over with an empty list.
+
+        This allows to reuse the visitor for further statements.
+
+        Returns:
+            A list of AST nodes, see `ast_nodes`
+        """
+        nodes = self.ast_nodes
+        self._ast_nodes = []
+        return nodes
+
     def visit_int_primitive_statement(
         self, stmt: prim_stmt.IntPrimitiveStatement
     ) -> None:
@@ -122,51 +150,50 @@ class StatementToAstVisitor(sv.StatementVisitor):
     ) -> None:
         owner = stmt.accessible_object().owner
         assert owner
+        target = au.create_var_name(self._variable_names, stmt.ret_val, False)
+        func = self._create_module_attribute(owner.__module__, owner.__name__)
+        args, kwargs = self._create_args_kwargs(stmt)
         self._ast_nodes.append(
             ast.Assign(
-                targets=[au.create_var_name(self._variable_names, stmt.ret_val, False)],
+                targets=[target],
                 value=ast.Call(
-                    func=ast.Attribute(
-                        attr=owner.__name__,
-                        ctx=ast.Load(),
-                        value=self._create_module_alias(owner.__module__),
-                    ),
-                    args=self._create_args(stmt),
-                    keywords=self._create_kw_args(stmt),
+                    func=func,
+                    args=args,
+                    keywords=kwargs,
                 ),
             )
         )
 
     def visit_method_statement(self, stmt: param_stmt.MethodStatement) -> None:
+        variable_names = self._variable_names
+        callee = au.create_var_name(variable_names, stmt.callee, True)
+        args, kwargs = self._create_args_kwargs(stmt)
         call = ast.Call(
             func=ast.Attribute(
                 attr=stmt.accessible_object().callable.__name__,
-                ctx=ast.Load(),
-                value=au.create_var_name(self._variable_names, stmt.callee, True),
+                ctx=au.LOAD,
+                value=callee,
             ),
-            args=self._create_args(stmt),
-            keywords=self._create_kw_args(stmt),
+            args=args,
+            keywords=kwargs,
         )
         if stmt.ret_val.is_none_type():
             node: ast.stmt = ast.Expr(value=call)
         else:
             node = ast.Assign(
-                targets=[au.create_var_name(self._variable_names, stmt.ret_val, False)],
+                targets=[au.create_var_name(variable_names, stmt.ret_val, False)],
                 value=call,
             )
         self._ast_nodes.append(node)
 
     def visit_function_statement(self, stmt: param_stmt.FunctionStatement) -> None:
+        function = stmt.accessible_object().callable
+        func = self._create_module_attribute(function.__module__, function.__name__)
+        args, kwargs = self._create_args_kwargs(stmt)
         call = ast.Call(
-            func=ast.Attribute(
-                attr=stmt.accessible_object().callable.__name__,
-                ctx=ast.Load(),
-                value=self._create_module_alias(
-                    stmt.accessible_object().callable.__module__
-                ),
-            ),
-            args=self._create_args(stmt),
-            keywords=self._create_kw_args(stmt),
+            func=func,
+            args=args,
+            keywords=kwargs,
         )
         if stmt.ret_val.is_none_type():
             node: ast.stmt = ast.Expr(value=call)
@@ -178,96 +205,93 @@ class StatementToAstVisitor(sv.StatementVisitor):
         self._ast_nodes.append(node)
 
     def visit_field_statement(self, stmt: field_stmt.FieldStatement) -> None:
+        variable_names = self._variable_names
         self._ast_nodes.append(
             ast.Assign(
                 targets=[
                     ast.Name(
-                        id=self._variable_names.get_name(stmt.ret_val),
-                        ctx=ast.Store(),
+                        id=variable_names.get_name(stmt.ret_val),
+                        ctx=au.STORE,
                     )
                 ],
                 value=ast.Attribute(
                     attr=stmt.field,
-                    ctx=ast.Load(),
-                    value=au.create_var_name(self._variable_names, stmt.source, True),
+                    ctx=au.LOAD,
+                    value=au.create_var_name(variable_names, stmt.source, True),
                 ),
             )
         )
 
     def visit_assignment_statement(self, stmt: assign_stmt.AssignmentStatement) -> None:
+        variable_names = self._variable_names
         self._ast_nodes.append(
             ast.Assign(
-                targets=[au.create_var_name(self._variable_names, stmt.ret_val, False)],
-                value=au.create_var_name(self._variable_names, stmt.rhs, True),
+                targets=[au.create_var_name(variable_names, stmt.ret_val, False)],
+                value=au.create_var_name(variable_names, stmt.rhs, True),
             )
         )
 
     def visit_list_statement(self, stmt: coll_stmt.ListStatement) -> None:
+        create_var_name = au.create_var_name
+        variable_names = self._variable_names
         self._ast_nodes.append(
             ast.Assign(
-                targets=[au.create_var_name(self._variable_names, stmt.ret_val, False)],
+                targets=[create_var_name(variable_names, stmt.ret_val, False)],
                 value=ast.List(
                     elts=[
-                        au.create_var_name(self._variable_names, x, True)
-                        for x in stmt.elements
+                        create_var_name(variable_names, x, True) for x in stmt.elements
                     ],
-                    ctx=ast.Load(),
+                    ctx=au.LOAD,
                 ),
             )
         )
 
     def visit_set_statement(self, stmt: coll_stmt.SetStatement) -> None:
         # There is no literal for empty sets, so we have to write "set()"
+        create_var_name = au.create_var_name
+        variable_names = self._variable_names
         inner: Any
         if len(stmt.elements) == 0:
-            inner = ast.Call(
-                func=ast.Name(id="set", ctx=ast.Load()), args=[], keywords=[]
-            )
+            inner = ast.Call(func=_SET_BUILTIN_NAME, args=[], keywords=[])
         else:
             inner = ast.Set(
-                elts=[
-                    au.create_var_name(self._variable_names, x, True)
-                    for x in stmt.elements
-                ],
-                ctx=ast.Load(),
+                elts=[create_var_name(variable_names, x, True) for x in stmt.elements],
+                ctx=au.LOAD,
             )
 
         self._ast_nodes.append(
             ast.Assign(
-                targets=[au.create_var_name(self._variable_names, stmt.ret_val, False)],
+                targets=[create_var_name(variable_names, stmt.ret_val, False)],
                 value=inner,
             )
         )
 
     def visit_tuple_statement(self, stmt: coll_stmt.TupleStatement) -> None:
+        create_var_name = au.create_var_name
+        variable_names = self._variable_names
         self._ast_nodes.append(
             ast.Assign(
-                targets=[au.create_var_name(self._variable_names, stmt.ret_val, False)],
+                targets=[create_var_name(variable_names, stmt.ret_val, False)],
                 value=ast.Tuple(
                     elts=[
-                        au.create_var_name(self._variable_names, x, True)
-                        for x in stmt.elements
+                        create_var_name(variable_names, x, True) for x in stmt.elements
                     ],
-                    ctx=ast.Load(),
+                    ctx=au.LOAD,
                 ),
             )
         )
 
     def visit_dict_statement(self, stmt: coll_stmt.DictStatement) -> None:
+        create_var_name = au.create_var_name
+        variable_names = self._variable_names
+        target = create_var_name(variable_names, stmt.ret_val, False)
+        keys: List[Optional[ast.expr]] = []
+        values: List[ast.expr] = []
+        for key, value in stmt.elements:
+            keys.append(create_var_name(variable_names, key, True))
+            values.append(create_var_name(variable_names, value, True))
         self._ast_nodes.append(
-            ast.Assign(
-                targets=[au.create_var_name(self._variable_names, stmt.ret_val, False)],
-                value=ast.Dict(
-                    keys=[
-                        au.create_var_name(self._variable_names, x[0], True)
-                        for x in stmt.elements
-                    ],
-                    values=[
-                        au.create_var_name(self._variable_names, x[1], True)
-                        for x in stmt.elements
-                    ],
-                ),
-            )
+            ast.Assign(targets=[target], value=ast.Dict(keys=keys, values=values))
         )
 
     def _create_constant(self, stmt: prim_stmt.PrimitiveStatement) -> ast.stmt:
@@ -284,98 +308,106 @@ class StatementToAstVisitor(sv.StatementVisitor):
             value=ast.Constant(value=stmt.value),
         )
 
-    def _create_args(self, stmt: param_stmt.ParametrizedStatement) -> List[ast.expr]:
+    def _create_args_kwargs(
+        self, stmt: param_stmt.ParametrizedStatement
+    ) -> Tuple[List[ast.expr], List[ast.keyword]]:
         """Creates the positional arguments, i.e., POSITIONAL_ONLY,
-        POSITIONAL_OR_KEYWORD and VAR_POSITIONAL.
+        POSITIONAL_OR_KEYWORD and VAR_POSITIONAL, as well as the keyword arguments,
+        i.e., KEYWORD_ONLY or VAR_KEYWORD, in a single pass over the parameters.
 
         Args:
             stmt: The parameterised statement
 
         Returns:
-            A list of AST statements
+            A list of positional arguments and a list of keyword arguments
         """
         args: List[ast.expr] = []
-        gen_callable: GenericCallableAccessibleObject = cast(
-            GenericCallableAccessibleObject, stmt.accessible_object()
-        )
-        for param_name in gen_callable.inferred_signature.parameters:
-            if param_name in stmt.args:
-                param_kind = gen_callable.inferred_signature.signature.parameters[
-                    param_name
-                ].kind
-                if param_kind in (
-                    Parameter.POSITIONAL_ONLY,
-                    Parameter.POSITIONAL_OR_KEYWORD,
-                ):
-                    args.append(
-                        au.create_var_name(
-                            self._variable_names, stmt.args[param_name], True
-                        )
+        kwargs: List[ast.keyword] = []
+        inferred_signature = stmt.accessible_object().inferred_signature
+        signature_parameters = inferred_signature.signature.parameters
+        stmt_args = stmt.args
+        variable_names = self._variable_names
+        create_var_name = au.create_var_name
+        for param_name in inferred_signature.parameters:
+            if param_name not in stmt_args:
+                continue
+            param_kind = signature_parameters[param_name].kind
+            if param_kind in (
+                Parameter.POSITIONAL_ONLY,
+                Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                args.append(
+                    create_var_name(variable_names, stmt_args[param_name], True)
+                )
+            elif param_kind == Parameter.VAR_POSITIONAL:
+                # Append *args, if necessary.
+                args.append(
+                    ast.Starred(
+                        value=create_var_name(
+                            variable_names, stmt_args[param_name], True
+                        ),
+                        ctx=au.LOAD,
                     )
-                elif param_kind == Parameter.VAR_POSITIONAL:
-                    # Append *args, if necessary.
-                    args.append(
-                        ast.Starred(
-                            value=au.create_var_name(
-                                self._variable_names, stmt.args[param_name], True
-                            ),
-                            ctx=ast.Load(),
-                        )
+                )
+            elif param_kind == Parameter.KEYWORD_ONLY:
+                kwargs.append(
+                    ast.keyword(
+                        arg=param_name,
+                        value=create_var_name(
+                            variable_names, stmt_args[param_name], True
+                        ),
                     )
-        return args
+                )
+            elif param_kind == Parameter.VAR_KEYWORD:
+                # Append **kwargs, if necessary.
+                kwargs.append(
+                    ast.keyword(
+                        arg=None,
+                        value=create_var_name(
+                            variable_names, stmt_args[param_name], True
+                        ),
+                    )
+                )
+        return args, kwargs
 
-    def _create_kw_args(
-        self, stmt: param_stmt.ParametrizedStatement
-    ) -> List[ast.keyword]:
-        """Creates the keyword arguments, i.e., KEYWORD_ONLY or VAR_KEYWORD.
+    def _create_module_alias(self, module_name) -> ast.Name:
+        """Create a name node for a module alias.
 
         Args:
-            stmt: The parameterised statement
+            module_name: The name of the module
 
         Returns:
-            A list of AST statements
+            An AST statement
         """
-        kwargs = []
-        gen_callable: GenericCallableAccessibleObject = cast(
-            GenericCallableAccessibleObject, stmt.accessible_object()
-        )
-        for param_name in gen_callable.inferred_signature.parameters:
-            if param_name in stmt.args:
-                param_kind = gen_callable.inferred_signature.signature.parameters[
-                    param_name
-                ].kind
-                if param_kind == Parameter.KEYWORD_ONLY:
-                    kwargs.append(
-                        ast.keyword(
-                            arg=param_name,
-                            value=au.create_var_name(
-                                self._variable_names, stmt.args[param_name], True
-                            ),
-                        )
-                    )
-                elif param_kind == Parameter.VAR_KEYWORD:
-                    # Append **kwargs, if necessary.
-                    kwargs.append(
-                        ast.keyword(
-                            arg=None,
-                            value=au.create_var_name(
-                                self._variable_names, stmt.args[param_name], True
-                            ),
-                        )
-                    )
-        return kwargs
+        # Name nodes are never modified, thus we reuse them for every call site.
+        node = self._module_alias_nodes.get(module_name)
+        if node is None:
+            node = ast.Name(id=self._module_aliases.get_name(module_name), ctx=au.LOAD)
+            self._module_alias_nodes[module_name] = node
+        return node
 
-    def _create_module_alias(self, module_name) -> ast.Name:
-        """Create a name node for a module alias.
+    def _create_module_attribute(self, module_name: str, name: str) -> ast.Attribute:
+        """Create an attribute node that accesses a name of a module via its alias.
 
         Args:
             module_name: The name of the module
+            name: The name of the accessed attribute
 
         Returns:
-            An AST statement
+            An AST attribute node
         """
-        return ast.Name(id=self._module_aliases.get_name(module_name), ctx=ast.Load())
+        # Like the alias nodes, the attribute nodes are reused for every call site.
+        key = (module_name, name)
+        node = self._module_attribute_nodes.get(key)
+        if node is None:
+            node = ast.Attribute(
+                attr=name,
+                ctx=au.LOAD,
+                value=self._create_module_alias(module_name),
+            )
+            self._module_attribute_nodes[key] = node
+        return node
 
 
-class DuckStatementToAstVisitor(StatementToAstVisitor):
-    """A visitor"""
+# The duck-typing visitor does not differ from the regular one.
+DuckStatementToAstVisitor = StatementToAstVisitor
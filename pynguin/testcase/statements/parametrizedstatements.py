@@ -67,6 +67,14 @@ class ParametrizedStatement(stmt.Statement, metaclass=ABCMeta):  # pylint: disab
     def args(self, args: Dict[str, vr.VariableReference]):
         self._args = args
 
+    def accessible_object(self) -> GenericCallableAccessibleObject:
+        """The used callable.
+
+        Returns:
+            The used callable
+        """
+        return self._generic_callable
+
     def get_variable_references(self) -> Set[vr.VariableReference]:
         references = set()
         references.add(self.ret_val)
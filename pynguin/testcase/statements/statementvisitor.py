@@ -14,6 +14,8 @@ from abc import ABC, abstractmethod
 class StatementVisitor(ABC):
     """An abstract statement visitor."""
 
+    __slots__ = ()
+
     @abstractmethod
     def visit_int_primitive_statement(self, stmt) -> None:
         """Visit int primitive.
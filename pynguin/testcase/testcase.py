@@ -155,6 +155,14 @@ class TestCase(metaclass=ABCMeta):
             A deep copy of this test case  # noqa: DAR202
         """
 
+    @abstractmethod
+    def clone_empty(self) -> TestCase:
+        """Provides a new test case of the same kind without any statements.
+
+        Returns:
+            An empty test case  # noqa: DAR202
+        """
+
     @abstractmethod
     def size(self) -> int:
         """Provides the number of statements in the test case.
@@ -41,11 +41,16 @@ class TestCaseToAstVisitor(TestCaseVisitor):
         )
         for statement in test_case.statements:
             statement.accept(statement_visitor)
+            assertions = statement.assertions
+            if not assertions:
+                # Most statements carry no assertions, thus we do not need an
+                # assertion visitor for them.
+                continue
             # TODO(fk) better way. Nest visitors?
             assertion_visitor = ata.AssertionToAstVisitor(
                 self._common_modules, variables
             )
-            for assertion in statement.assertions:
+            for assertion in assertions:
                 assertion.accept(assertion_visitor)
             statement_visitor.append_nodes(assertion_visitor.nodes)
         self._test_case_asts.append(statement_visitor.ast_nodes)
@@ -1301,10 +1301,8 @@ class TestFactory:
         Returns:
             True, iff the test case has a call on the SUT.
         """
+        objects_under_test = self._test_cluster.accessible_objects_under_test
         for statement in test_case.statements:
-            if (
-                statement.accessible_object()
-                in self._test_cluster.accessible_objects_under_test
-            ):
+            if statement.accessible_object() in objects_under_test:
                 return True
         return False
@@ -5,15 +5,19 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 """Provides a strategy implementation that uses type hints."""
+import functools
 import inspect
 import typing
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from pynguin.typeinference.strategy import InferredSignature, TypeInferenceStrategy
 
 # pylint: disable=too-few-public-methods
 from pynguin.utils.type_utils import wrap_var_param_type
 
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+
 
 class TypeHintsInferenceStrategy(TypeInferenceStrategy):
     """A type inference strategy that simply parses the type hints.
@@ -28,14 +32,17 @@ class TypeHintsInferenceStrategy(TypeInferenceStrategy):
 
     @staticmethod
     def _infer_type_info_for_callable(method: Callable) -> InferredSignature:
-        signature = inspect.signature(method)
+        signature, hints = _inspect_callable(method)
         parameters: Dict[str, Optional[type]] = {}
-        hints = typing.get_type_hints(method)
-        for param_name in signature.parameters:
+        hints_get = hints.get
+        for param_name, param in signature.parameters.items():
             if param_name == "self":
                 continue
-            hint = hints.get(param_name, None)
-            hint = wrap_var_param_type(hint, signature.parameters[param_name].kind)
+            hint = hints_get(param_name)
+            kind = param.kind
+            # Only the types of *args and **kwargs need to be wrapped.
+            if kind is _VAR_POSITIONAL or kind is _VAR_KEYWORD:
+                hint = wrap_var_param_type(hint, kind)
             parameters[param_name] = hint
 
         return_type: Optional[type] = hints.get("return", None)
@@ -43,3 +50,24 @@ class TypeHintsInferenceStrategy(TypeInferenceStrategy):
         return InferredSignature(
             signature=signature, parameters=parameters, return_type=return_type
         )
+
+
+# Inspecting a callable, especially resolving its type hints, is expensive.  The test
+# cluster generation inspects the same callables repeatedly: every `__init__` once as
+# constructor and once as class member, and inherited methods once per subclass.
+# Thus, keep the results of the most recently inspected callables, which are only
+# read.
+@functools.lru_cache(maxsize=128)
+def _cached_inspect_callable(
+    method: Callable,
+) -> Tuple[inspect.Signature, Dict[str, Any]]:
+    return inspect.signature(method), typing.get_type_hints(method)
+
+
+def _inspect_callable(method: Callable) -> Tuple[inspect.Signature, Dict[str, Any]]:
+    try:
+        hash(method)
+    except TypeError:
+        # The callable is not hashable, thus it cannot be cached.
+        return inspect.signature(method), typing.get_type_hints(method)
+    return _cached_inspect_callable(method)
@@ -10,6 +10,11 @@ import ast
 import pynguin.testcase.variable.variablereference as vr
 from pynguin.utils.namingscope import NamingScope
 
+# Context nodes carry no state and generated ASTs are never modified in place, thus
+# all generated nodes share these instances.
+LOAD = ast.Load()
+STORE = ast.Store()
+
 
 def create_var_name(
     variable_names: NamingScope, var: vr.VariableReference, load: bool
@@ -26,5 +31,5 @@ def create_var_name(
     """
     return ast.Name(
         id=variable_names.get_name(var),
-        ctx=ast.Load() if load else ast.Store(),
+        ctx=LOAD if load else STORE,
     )
@@ -5,8 +5,10 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 """Provides a singleton instance of Random that can be seeded."""
+import math
 import random
 import string
+import sys
 from typing import Any, List, Optional, Sequence
 
 
@@ -101,6 +103,27 @@ def next_float(lower_bound=0, upper_bound=1) -> float:
     return RNG.uniform(lower_bound, upper_bound)
 
 
+def next_geometric(probability: float) -> int:
+    """Provide the number of failed Bernoulli trials before the first success.
+
+    Drawing this number directly only requires a single random number, instead of
+    one random number per trial.  The result is capped at `sys.maxsize`.
+
+    Args:
+        probability: The success probability of a single trial, in (0, 1]
+
+    Returns:
+        The number of failed trials before the first successful one
+    """
+    assert 0.0 < probability <= 1.0
+    uniform = next_float()
+    if uniform >= 1.0:
+        return sys.maxsize
+    if probability >= 1.0:
+        return 0
+    return min(int(math.log1p(-uniform) / math.log1p(-probability)), sys.maxsize)
+
+
 def next_gaussian() -> float:
     """Returns the next pseudorandom, Gaussian ("normally") distributed
     value with mu 0.0 and sigma 1.0.
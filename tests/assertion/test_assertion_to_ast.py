@@ -37,6 +37,15 @@ def test_not_none(assertion_to_ast):
     )
 
 
+def test_not_none_non_bool_value(assertion_to_ast):
+    assertion = MagicMock(value=None)
+    assertion_to_ast.visit_none_assertion(assertion)
+    assert (
+        astor.to_source(Module(body=assertion_to_ast.nodes))
+        == "assert var0 is not None\n"
+    )
+
+
 def test_primitive_bool(assertion_to_ast):
     assertion = MagicMock(value=True)
     assertion_to_ast.visit_primitive_assertion(assertion)
@@ -58,3 +67,13 @@ def test_primitive_non_bool(assertion_to_ast):
     assertion = MagicMock(value=42)
     assertion_to_ast.visit_primitive_assertion(assertion)
     assert astor.to_source(Module(body=assertion_to_ast.nodes)) == "assert var0 == 42\n"
+
+
+def test_primitive_float_multiple(assertion_to_ast):
+    assertion_to_ast.visit_primitive_assertion(MagicMock(value=1.5))
+    assertion_to_ast.visit_primitive_assertion(MagicMock(value=2.5))
+    assert (
+        astor.to_source(Module(body=assertion_to_ast.nodes))
+        == "assert var0 == pytest.approx(1.5, abs=0.01, rel=0.01)\n"
+        "assert var1 == pytest.approx(2.5, abs=0.01, rel=0.01)\n"
+    )
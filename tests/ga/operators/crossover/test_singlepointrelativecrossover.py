@@ -8,6 +8,7 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 import pynguin.ga.operators.crossover.singlepointrelativecrossover as cross
+import pynguin.ga.testcasechromosome as tcc
 import pynguin.ga.testsuitechromosome as tsc
 
 
@@ -30,10 +31,30 @@ def test_single_point_relative_crossover():
         parent1.size.return_value = 10
         parent2 = MagicMock(tsc.TestSuiteChromosome)
         parent2.size.return_value = 20
-        clone1 = MagicMock(tsc.TestSuiteChromosome)
-        clone2 = MagicMock(tsc.TestSuiteChromosome)
-        parent1.clone.return_value = clone1
-        parent2.clone.return_value = clone2
-        crossover.cross_over(parent1, parent2)
-        parent1.cross_over.assert_called_with(clone2, 7, 14)
-        parent2.cross_over.assert_called_with(clone1, 14, 7)
+        original1 = MagicMock(tsc.TestSuiteChromosome)
+        with mock.patch("copy.copy") as copy_mock:
+            copy_mock.return_value = original1
+            crossover.cross_over(parent1, parent2)
+            copy_mock.assert_called_once_with(parent1)
+        parent1.cross_over.assert_called_with(parent2, 7, 14)
+        parent2.cross_over.assert_called_with(original1, 14, 7)
+        parent1.clone.assert_not_called()
+        parent2.clone.assert_not_called()
+
+
+def test_single_point_relative_crossover_keeps_original_parent():
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        float_mock.return_value = 0.5
+        tests1 = [MagicMock(tcc.TestCaseChromosome) for _ in range(3)]
+        tests2 = [MagicMock(tcc.TestCaseChromosome) for _ in range(3)]
+        parent1 = tsc.TestSuiteChromosome()
+        parent2 = tsc.TestSuiteChromosome()
+        for test in tests1:
+            test.clone.return_value = test
+            parent1.add_test_case_chromosome(test)
+        for test in tests2:
+            test.clone.return_value = test
+            parent2.add_test_case_chromosome(test)
+        cross.SinglePointRelativeCrossOver().cross_over(parent1, parent2)
+        assert parent1.test_case_chromosomes == tests1[:2] + tests2[2:]
+        assert parent2.test_case_chromosomes == tests2[:2] + tests1[2:]
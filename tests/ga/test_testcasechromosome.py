@@ -4,6 +4,7 @@
 #
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
+import sys
 from unittest import mock
 from unittest.mock import MagicMock, call
 
@@ -100,7 +101,7 @@ def test_mutation_insert_two():
     config.configuration.search_algorithm.statement_insertion_probability = 0.5
     config.configuration.search_algorithm.chromosome_length = 10
     with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
-        float_mock.side_effect = [0.2, 0.2, 0.2]
+        float_mock.side_effect = [0.1]
         assert chromosome._mutation_insert()
     test_factory.insert_random_statement.assert_has_calls(
         [call(test_case, 0), call(test_case, 1)]
@@ -119,7 +120,7 @@ def test_mutation_insert_twice_no_success():
     config.configuration.search_algorithm.statement_insertion_probability = 0.5
     config.configuration.search_algorithm.chromosome_length = 10
     with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
-        float_mock.side_effect = [0.2, 0.2, 0.2]
+        float_mock.side_effect = [0.1]
         assert not chromosome._mutation_insert()
     test_factory.insert_random_statement.assert_has_calls(
         [call(test_case, 0), call(test_case, 0)]
@@ -139,7 +140,7 @@ def test_mutation_insert_max_length():
     config.configuration.search_algorithm.statement_insertion_probability = 0.5
     config.configuration.search_algorithm.chromosome_length = 1
     with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
-        float_mock.side_effect = [0.0, 0.0]
+        float_mock.side_effect = [0.0]
         assert chromosome._mutation_insert()
     test_factory.insert_random_statement.assert_has_calls([call(test_case, 0)])
     assert test_case.size() == 1
@@ -178,6 +179,26 @@ def test_mutation_change_call_success(constructor_mock, result):
             assert const0.ret_val.distance == 5
 
 
+def test_mutation_change_geometric_skips(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    statements = [prim.IntPrimitiveStatement(test_case, value) for value in range(4)]
+    for statement in statements:
+        test_case.add_statement(statement)
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        # With four statements each trial succeeds with probability 0.25, thus
+        # 0.3 skips one statement and 0.1 skips none.
+        float_mock.side_effect = [0.3, 0.3, 0.1]
+        with mock.patch.object(
+            prim.IntPrimitiveStatement, "mutate", autospec=True
+        ) as mutate_mock:
+            mutate_mock.return_value = True
+            assert chromosome._mutation_change()
+            assert [args[0] for args, _ in mutate_mock.call_args_list] == [
+                statements[1],
+                statements[3],
+            ]
+
+
 def test_mutation_change_no_change(test_case_chromosome_with_test):
     chromosome, test_case = test_case_chromosome_with_test
     test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
@@ -210,19 +231,40 @@ def test_mutation_delete_not_empty():
     test_case.add_statement(int1)
     with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
         float_mock.side_effect = [0.0, 1.0]
-        with mock.patch.object(chromosome, "_delete_statement") as delete_mock:
+        with mock.patch.object(
+            tcc.TestCaseChromosome, "_delete_statement"
+        ) as delete_mock:
             delete_mock.return_value = True
             assert chromosome._mutation_delete()
             delete_mock.assert_has_calls([call(1)])
             assert delete_mock.call_count == 1
 
 
+def test_mutation_delete_geometric_skips():
+    test_case = dtc.DefaultTestCase()
+    chromosome = tcc.TestCaseChromosome(test_case)
+    for value in range(4):
+        test_case.add_statement(prim.IntPrimitiveStatement(test_case, value))
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        # With four statements each trial succeeds with probability 0.25, thus
+        # 0.3 skips one statement and 0.99 skips beyond the first statement.
+        float_mock.side_effect = [0.3, 0.3, 0.99]
+        with mock.patch.object(
+            tcc.TestCaseChromosome, "_delete_statement"
+        ) as delete_mock:
+            delete_mock.return_value = True
+            assert chromosome._mutation_delete()
+            assert delete_mock.call_args_list == [call(2), call(0)]
+
+
 def test_mutation_delete_skipping():
     test_case = dtc.DefaultTestCase()
     chromosome = tcc.TestCaseChromosome(test_case)
-    with mock.patch.object(chromosome, "_delete_statement") as delete_mock:
+    with mock.patch.object(tcc.TestCaseChromosome, "_delete_statement") as delete_mock:
         delete_mock.return_value = True
-        with mock.patch.object(chromosome, "get_last_mutatable_statement") as mut_mock:
+        with mock.patch.object(
+            tcc.TestCaseChromosome, "get_last_mutatable_statement"
+        ) as mut_mock:
             mut_mock.return_value = 3
             assert not chromosome._mutation_delete()
             assert delete_mock.call_count == 0
@@ -236,7 +278,9 @@ def test_mutate_chop(test_case_chromosome_with_test):
     config.configuration.search_algorithm.test_insert_probability = 0.0
     config.configuration.search_algorithm.test_change_probability = 0.0
     config.configuration.search_algorithm.test_delete_probability = 0.0
-    with mock.patch.object(chromosome, "get_last_mutatable_statement") as mut_mock:
+    with mock.patch.object(
+        tcc.TestCaseChromosome, "get_last_mutatable_statement"
+    ) as mut_mock:
         mut_mock.return_value = 5
         with mock.patch.object(chromosome, "_test_factory") as factory_mock:
             factory_mock.has_call_on_sut.return_value = True
@@ -254,7 +298,9 @@ def test_mutate_no_chop(test_case_chromosome_with_test):
     config.configuration.search_algorithm.test_insert_probability = 0.0
     config.configuration.search_algorithm.test_change_probability = 0.0
     config.configuration.search_algorithm.test_delete_probability = 0.0
-    with mock.patch.object(chromosome, "get_last_mutatable_statement") as mut_mock:
+    with mock.patch.object(
+        tcc.TestCaseChromosome, "get_last_mutatable_statement"
+    ) as mut_mock:
         mut_mock.return_value = None
         with mock.patch.object(chromosome, "_test_factory") as factory_mock:
             factory_mock.has_call_on_sut.return_value = True
@@ -279,7 +325,7 @@ def test_mutate_all(test_case_chromosome, func, rand, result):
     test_case_chromosome.set_changed(False)
     with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
         float_mock.side_effect = rand
-        with mock.patch.object(test_case_chromosome, func) as mock_func:
+        with mock.patch.object(tcc.TestCaseChromosome, func) as mock_func:
             mock_func.return_value = result
             with mock.patch.object(
                 test_case_chromosome, "_test_factory"
@@ -300,15 +346,17 @@ def test_crossover_success():
     test_case0 = MagicMock(dtc.DefaultTestCase)
     test_case0_clone = MagicMock(dtc.DefaultTestCase)
     test_case0_clone.size.return_value = 5
-    test_case0.clone.return_value = test_case0_clone
+    test_case0.clone_empty.return_value = test_case0_clone
     test_case1 = MagicMock(dtc.DefaultTestCase)
     test_case1.size.return_value = 7
     left = tcc.TestCaseChromosome(test_case0, test_factory=test_factory)
     right = tcc.TestCaseChromosome(test_case1, test_factory=test_factory)
 
+    test_case0.statements = [MagicMock() for _ in range(5)]
     left.cross_over(right, 4, 3)
-    assert test_case0.get_statement.call_count == 4
-    assert test_case0_clone.add_statement.call_count == 4
+    test_case0_clone.add_statements.assert_called_once_with(
+        [statement.clone.return_value for statement in test_case0.statements[:4]]
+    )
     assert test_case1.get_statement.call_count == 4
     assert test_factory.append_statement.call_count == 4
 
@@ -318,7 +366,7 @@ def test_crossover_too_large():
     test_case0 = MagicMock(dtc.DefaultTestCase)
     test_case0_clone = MagicMock(dtc.DefaultTestCase)
     test_case0_clone.size.return_value = 5
-    test_case0.clone.return_value = test_case0_clone
+    test_case0.clone_empty.return_value = test_case0_clone
     test_case1 = MagicMock(dtc.DefaultTestCase)
     test_case1.size.return_value = 7
     left = tcc.TestCaseChromosome(test_case0, test_factory=test_factory)
@@ -346,3 +394,116 @@ def test_accept(test_case_chromosome):
     visitor = MagicMock()
     test_case_chromosome.accept(visitor)
     visitor.visit_test_case_chromosome.assert_called_once_with(test_case_chromosome)
+
+
+def test_get_last_mutatable_statement_cached(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    result = MagicMock(ExecutionResult)
+    result.has_test_exceptions.return_value = True
+    result.get_first_position_of_thrown_exception.return_value = 0
+    chromosome.set_last_execution_result(result)
+    assert chromosome.get_last_mutatable_statement() == 0
+    assert chromosome.get_last_mutatable_statement() == 0
+    result.get_first_position_of_thrown_exception.assert_called_once()
+
+
+def test_get_last_mutatable_statement_cache_invalidated(
+    test_case_chromosome_with_test,
+):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    assert chromosome.get_last_mutatable_statement() == 0
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    assert chromosome.get_last_mutatable_statement() == 1
+    result = MagicMock(ExecutionResult)
+    result.has_test_exceptions.return_value = True
+    result.get_first_position_of_thrown_exception.return_value = 0
+    chromosome.set_last_execution_result(result)
+    assert chromosome.get_last_mutatable_statement() == 0
+
+
+def test_mutate_insert_only_no_backup():
+    test_case = MagicMock(dtc.DefaultTestCase)
+    test_case.size.return_value = 0
+    chromosome = tcc.TestCaseChromosome(test_case, test_factory=MagicMock())
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        float_mock.side_effect = [1, 1, 0]
+        with mock.patch.object(
+            tcc.TestCaseChromosome, "_mutation_insert"
+        ) as insert_mock:
+            chromosome.mutate()
+            insert_mock.assert_called_once()
+    test_case.clone.assert_not_called()
+
+
+def test_mutate_restores_backup_without_call_on_sut():
+    test_case = MagicMock(dtc.DefaultTestCase)
+    test_case.size.return_value = 0
+    backup = MagicMock(dtc.DefaultTestCase)
+    test_case.clone.return_value = backup
+    test_factory = MagicMock(tf.TestFactory)
+    test_factory.has_call_on_sut.return_value = False
+    chromosome = tcc.TestCaseChromosome(test_case, test_factory=test_factory)
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        float_mock.side_effect = [0, 0, 1]
+        with mock.patch.object(tcc.TestCaseChromosome, "_mutation_delete"):
+            with mock.patch.object(tcc.TestCaseChromosome, "_mutation_change"):
+                with mock.patch.object(tcc.TestCaseChromosome, "_mutation_insert"):
+                    chromosome.mutate()
+    test_case.clone.assert_called_once()
+    assert chromosome.test_case is backup
+
+
+@pytest.mark.parametrize(
+    "alpha,rand,count",
+    [
+        pytest.param(0.0, None, 0),
+        pytest.param(0.5, 0.6, 0),
+        pytest.param(0.5, 0.4, 1),
+        pytest.param(0.5, 0.1, 2),
+        pytest.param(0.5, 0.0, sys.maxsize),
+        pytest.param(1.0, 0.5, sys.maxsize),
+    ],
+)
+def test_next_insertion_count(alpha, rand, count):
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        float_mock.return_value = rand
+        assert tcc._next_insertion_count(alpha) == count
+
+
+def test_hash_cached():
+    test_case = MagicMock(dtc.DefaultTestCase)
+    test_case.size.return_value = 1
+    test_case.__hash__.return_value = 42
+    chromosome = tcc.TestCaseChromosome(test_case)
+    assert hash(chromosome) == 42
+    assert hash(chromosome) == 42
+    test_case.__hash__.assert_called_once()
+
+
+def test_hash_invalidated_on_change():
+    test_case = MagicMock(dtc.DefaultTestCase)
+    test_case.size.return_value = 1
+    test_case.__hash__.return_value = 42
+    chromosome = tcc.TestCaseChromosome(test_case)
+    assert hash(chromosome) == 42
+    test_case.__hash__.return_value = 43
+    chromosome.set_changed(True)
+    assert hash(chromosome) == 43
+
+
+def test_hash_invalidated_on_size_change(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    old_hash = hash(chromosome)
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 6))
+    assert hash(chromosome) == hash(test_case) != old_hash
+
+
+def test_size_and_length(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    assert chromosome.size() == chromosome.length() == 2
@@ -199,6 +199,14 @@ def test_clone(default_test_case):
     assert result.get_statement(0) == stmt
 
 
+def test_clone_empty(default_test_case):
+    default_test_case._statements = [MagicMock(st.Statement)]
+    result = default_test_case.clone_empty()
+    assert isinstance(result, dtc.DefaultTestCase)
+    assert result.id != default_test_case.id
+    assert result.size() == 0
+
+
 def test_statements(default_test_case):
     assert default_test_case.statements == []
 
@@ -16,6 +16,7 @@ import pynguin.testcase.statement_to_ast as stmt_to_ast
 import pynguin.testcase.statements.collectionsstatements as coll_stmt
 import pynguin.testcase.statements.fieldstatement as field_stmt
 import pynguin.testcase.statements.parametrizedstatements as param_stmt
+import pynguin.testcase.statements.primitivestatements as prim_stmt
 import pynguin.testcase.statements.statement as stmt
 import pynguin.testcase.variable.variablereference as vr
 from pynguin.typeinference.strategy import InferredSignature
@@ -265,6 +266,25 @@ def test_statement_to_ast_function_args(
     assert astor.to_source(Module(body=statement_to_ast_visitor.ast_nodes)) == expected
 
 
+def test_statement_to_ast_module_alias_reused(statement_to_ast_visitor):
+    first = statement_to_ast_visitor._create_module_alias("foo")
+    second = statement_to_ast_visitor._create_module_alias("foo")
+    other = statement_to_ast_visitor._create_module_alias("bar")
+    assert first is second
+    assert first.id == "module0"
+    assert other.id == "module1"
+
+
+def test_statement_to_ast_module_attribute_reused(statement_to_ast_visitor):
+    first = statement_to_ast_visitor._create_module_attribute("foo", "bar")
+    second = statement_to_ast_visitor._create_module_attribute("foo", "bar")
+    other = statement_to_ast_visitor._create_module_attribute("foo", "baz")
+    assert first is second
+    assert other is not first
+    assert other.value is first.value
+    assert astor.to_source(first).strip() == "module0.bar"
+
+
 def test_statement_to_ast_with_wrap():
     var_names = NamingScope()
     module_aliases = NamingScope(prefix="module")
@@ -280,6 +300,13 @@ def test_statement_to_ast_with_wrap():
     )
 
 
+def test_statement_to_ast_pop_nodes(statement_to_ast_visitor, test_case_mock):
+    prim_stmt.IntPrimitiveStatement(test_case_mock, 5).accept(statement_to_ast_visitor)
+    nodes = statement_to_ast_visitor.pop_nodes()
+    assert astor.to_source(Module(body=nodes)) == "var0 = 5\n"
+    assert statement_to_ast_visitor.ast_nodes == []
+
+
 def test_statement_to_ast_list_single(
     statement_to_ast_visitor, test_case_mock, function_mock
 ):
@@ -961,3 +961,21 @@ def test_create_or_reuse_variable_no_guessing(test_case_mock):
     factory = tf.TestFactory(cluster)
     config.configuration.type_inference.guess_unknown_types = False
     assert factory._create_or_reuse_variable(test_case_mock, None, 1, 1, True) is None
+
+
+def test_has_call_on_sut(function_mock):
+    test_case = dtc.DefaultTestCase()
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    test_case.add_statement(par_stmt.FunctionStatement(test_case, function_mock))
+    cluster = MagicMock(TestCluster)
+    cluster.accessible_objects_under_test = {function_mock}
+    assert tf.TestFactory(cluster).has_call_on_sut(test_case)
+
+
+def test_has_no_call_on_sut(function_mock):
+    test_case = dtc.DefaultTestCase()
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    test_case.add_statement(par_stmt.FunctionStatement(test_case, function_mock))
+    cluster = MagicMock(TestCluster)
+    cluster.accessible_objects_under_test = set()
+    assert not tf.TestFactory(cluster).has_call_on_sut(test_case)
@@ -4,7 +4,9 @@
 #
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
-from typing import Any, Tuple, Union
+import inspect
+from typing import Any, Dict, List, Tuple, Union
+from unittest import mock
 
 import pytest
 
@@ -23,6 +25,10 @@ def union_dummy(a: Union[int, float], b: Union[int, float]) -> Union[int, float]
     return a + b  # pragma: no cover
 
 
+def var_param_dummy(a: int, *args: str, **kwargs: float) -> None:
+    pass  # pragma: no cover
+
+
 def return_tuple() -> Tuple[int, int]:
     return 23, 42  # pragma: no cover
 
@@ -57,6 +63,11 @@ class UntypedDummy:
             {"a": Union[int, float], "b": Union[int, float]},
             Union[int, float],
         ),
+        pytest.param(
+            var_param_dummy,
+            {"a": int, "args": List[str], "kwargs": Dict[str, float]},
+            type(None),
+        ),
         pytest.param(return_tuple, {}, Tuple[int, int]),
         pytest.param(return_tuple_no_annotation, {}, None),
         pytest.param(TypedDummy, {"a": Any}, type(None)),
@@ -68,3 +79,45 @@ def test_infer_type_info(method, expected_parameters, expected_return_types):
     result = strategy.infer_type_info(method)
     assert result.parameters == expected_parameters
     assert result.return_type == expected_return_types
+
+
+def test_infer_type_info_inspects_callable_once():
+    def dummy(a: int) -> str:
+        return str(a)  # pragma: no cover
+
+    strategy = TypeHintsInferenceStrategy()
+    with mock.patch("inspect.signature", wraps=inspect.signature) as signature_mock:
+        first = strategy.infer_type_info(dummy)
+        second = strategy.infer_type_info(dummy)
+    signature_mock.assert_called_once_with(dummy)
+    assert first.parameters == second.parameters == {"a": int}
+    assert first.return_type == second.return_type == str
+
+
+class UnhashableCallable:
+    __hash__ = None  # type: ignore
+
+    def __call__(self, a: int) -> float:
+        return float(a)  # pragma: no cover
+
+
+def test_infer_type_info_unhashable_callable():
+    method = UnhashableCallable()
+    strategy = TypeHintsInferenceStrategy()
+    with mock.patch("typing.get_type_hints", return_value={"a": int}):
+        result = strategy.infer_type_info(method)
+    assert result.signature == inspect.signature(method)
+    assert result.parameters == {"a": int}
+
+
+def test_infer_type_info_error_not_retried():
+    def dummy(a: int) -> str:
+        return str(a)  # pragma: no cover
+
+    strategy = TypeHintsInferenceStrategy()
+    with mock.patch(
+        "typing.get_type_hints", side_effect=TypeError("bad annotation")
+    ) as hints_mock:
+        with pytest.raises(TypeError):
+            strategy.infer_type_info(dummy)
+    hints_mock.assert_called_once_with(dummy)
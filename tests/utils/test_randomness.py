@@ -4,9 +4,13 @@
 #
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
+import random
 import string
+import sys
+from unittest import mock
 
 import hypothesis.strategies as st
+import pytest
 from hypothesis import given
 
 import pynguin.utils.randomness as randomness
@@ -95,3 +99,41 @@ def test_set_get_seed(seed):
     rng = randomness.Random()
     rng.seed(seed)
     assert rng.get_seed() == seed
+
+
+def test_next_geometric_certain():
+    assert randomness.next_geometric(1.0) == 0
+
+
+def test_next_geometric_skips_failed_trials():
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        # log(1 - 0.3) / log(1 - 0.25) ~= 1.24, i.e., one failed trial.
+        float_mock.return_value = 0.3
+        assert randomness.next_geometric(0.25) == 1
+
+
+def test_next_geometric_mean():
+    rng = random.Random(42)
+    with mock.patch("pynguin.utils.randomness.next_float", side_effect=rng.random):
+        draws = [randomness.next_geometric(0.25) for _ in range(20000)]
+    assert min(draws) == 0
+    # The expected number of failed trials is (1 - p) / p = 3.
+    assert sum(draws) / len(draws) == pytest.approx(3.0, abs=0.1)
+
+
+def test_next_geometric_first_trial_succeeds():
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        float_mock.return_value = 0.2
+        assert randomness.next_geometric(0.5) == 0
+
+
+def test_next_geometric_trials_fail():
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        float_mock.return_value = 0.8
+        assert randomness.next_geometric(0.5) == 2
+
+
+def test_next_geometric_never_succeeds():
+    with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+        float_mock.return_value = 1.0
+        assert randomness.next_geometric(0.5) == sys.maxsize